@@ -16,7 +16,8 @@ State is saved in /var/lib/stealth_tool/state.json so restore options can revert
 Safety: This script performs privileged operations (stopping NetworkManager, changing interfaces, truncating logs).
 Only run on systems and networks you own or where you have explicit permission.
 
-Dependencies: aircrack-ng (airmon-ng), macchanger (optional), iproute2, iw, systemd (journalctl)
+Dependencies: aircrack-ng (airmon-ng), macchanger (optional), iproute2, iw, systemd (journalctl),
+pyroute2 (optional; lists wireless interfaces without spawning iw), orjson (optional; faster state I/O)
 
 Save as /usr/local/bin/stealth, chmod +x /usr/local/bin/stealth
 """
@@ -25,11 +26,29 @@ import os
 import sys
 import subprocess
 import shutil
-import random
+import signal
+import functools
 import re
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from pyroute2 import IW, NetlinkError
+except ImportError:
+    IW = None
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    _loads = json.loads
+
 # ----- configuration -----
 LOG_FILES = [
     "/var/log/auth.log",
@@ -40,9 +59,24 @@ LOG_FILES = [
     "/var/log/lastlog",
 ]
 
+_IFACE_RE = re.compile(r"Interface\s+(\S+)")
+_MAC_RE = re.compile(r"link/ether\s+([0-9a-f:]{17})")
+
 STATE_DIR = Path('/var/lib/stealth_tool')
 STATE_FILE = STATE_DIR / 'state.json'
 
+
+@functools.lru_cache(maxsize=None)
+def _which(name):
+    """shutil.which, cached so PATH is searched at most once per command."""
+    return shutil.which(name)
+
+
+# optional tools, resolved once at startup (shares the _which cache with _resolve)
+HAS_AIRMON = _which('airmon-ng') is not None
+HAS_MACCHANGER = _which('macchanger') is not None
+HAS_JOURNALCTL = _which('journalctl') is not None
+
 # ----- helpers -----
 
 def ensure_state_dir():
@@ -56,7 +90,7 @@ def load_state():
     ensure_state_dir()
     if STATE_FILE.exists():
         try:
-            return json.loads(STATE_FILE.read_text())
+            return _loads(STATE_FILE.read_bytes())
         except Exception:
             return {}
     return {}
@@ -64,13 +98,32 @@ def load_state():
 
 def save_state(state: dict):
     ensure_state_dir()
+    # write + fsync a temp file, then rename it over the old one, so a crash or power
+    # loss leaves either the old or the new state, never a truncated file
+    tmp = STATE_FILE.with_suffix('.json.tmp')
     try:
-        STATE_FILE.write_text(json.dumps(state, indent=2))
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, _dumps(state))
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, STATE_FILE)
+        dfd = os.open(STATE_DIR, os.O_RDONLY)
+        try:
+            os.fsync(dfd)
+        finally:
+            os.close(dfd)
     except Exception as e:
         print(f"[!] Could not write state file: {e}")
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
 
 
-def clear_state():
+def clear_state(state: dict):
+    state.clear()
     try:
         if STATE_FILE.exists():
             STATE_FILE.unlink()
@@ -84,27 +137,180 @@ def check_root():
         sys.exit(1)
 
 
-def run(cmd, capture=False):
+def _resolve(name):
+    """Return the full path of a command via the cached _which lookup."""
+    path = _which(name)
+    if path is None:
+        raise FileNotFoundError(f"{name}: command not found")
+    return path
+
+
+def _reap(pid):
+    """Wait for pid and return its exit code; on Ctrl+C, reap (or kill) the child before re-raising."""
+    try:
+        _, status = os.waitpid(pid, 0)
+    except KeyboardInterrupt:
+        # like subprocess.run: the child got the same SIGINT, give it a moment, then kill it
+        deadline = time.monotonic() + 0.25
+        while time.monotonic() < deadline:
+            if os.waitpid(pid, os.WNOHANG)[0]:
+                raise
+            time.sleep(0.01)
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        raise
+    return os.waitstatus_to_exitcode(status)
+
+
+def spawn_wait(argv, stdin_text=None, output=None):
+    """posix_spawn argv and return its exit code.
+
+    stdin is fed from stdin_text (default /dev/null). stdout/stderr are inherited, unless
+    output is a list, in which case they are captured and appended to it.
+    """
+    actions = []
+    in_w = out_r = None
+    child_ends = []
+    try:
+        if stdin_text is None:
+            actions.append((os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0))
+        else:
+            in_r, in_w = os.pipe()
+            child_ends.append(in_r)
+            actions.append((os.POSIX_SPAWN_DUP2, in_r, 0))
+        if output is not None:
+            out_r, out_w = os.pipe()
+            child_ends.append(out_w)
+            actions += [(os.POSIX_SPAWN_DUP2, out_w, 1), (os.POSIX_SPAWN_DUP2, out_w, 2)]
+        # CPython ignores SIGPIPE/SIGXFSZ; reset them as subprocess' restore_signals does
+        pid = os.posix_spawn(_resolve(argv[0]), argv, os.environ, file_actions=actions,
+                             setsigdef=(signal.SIGPIPE, signal.SIGXFSZ))
+    except BaseException:
+        for fd in (in_w, out_r):
+            if fd is not None:
+                os.close(fd)
+        raise
+    finally:
+        for fd in child_ends:
+            os.close(fd)
+
+    try:
+        # stdin is written in full before output is read; fine for the small ip batches fed here
+        if in_w is not None:
+            try:
+                os.write(in_w, stdin_text.encode())
+            except BrokenPipeError:
+                pass
+            finally:
+                os.close(in_w)
+                in_w = None
+        if out_r is not None:
+            with open(out_r, errors='replace') as f:
+                out_r = None
+                text = f.read()
+            if text:
+                output.append(text.rstrip('\n'))
+    except BaseException:
+        for fd in (in_w, out_r):
+            if fd is not None:
+                os.close(fd)
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        raise
+    return _reap(pid)
+
+
+def run(argv, capture=False, capture_stderr=False, stdin_text=None, out=None):
+    """Run argv directly (no shell). Returns the CompletedProcess, or None on failure.
+
+    capture=True pipes stdout only (stderr is discarded) unless capture_stderr is also set.
+    If out is a list, the command's output and any failure message are appended to it
+    instead of going to the terminal, so worker threads can report in order.
+    """
+    report = print if out is None else out.append
     try:
         if capture:
-            return subprocess.run(cmd, shell=True, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            stderr = subprocess.PIPE if capture_stderr else subprocess.DEVNULL
+            res = subprocess.run(argv, input=stdin_text, stdout=subprocess.PIPE, stderr=stderr, text=True)
         else:
-            return subprocess.run(cmd, shell=True, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"[!] Command failed: {e}")
+            res = subprocess.CompletedProcess(argv, spawn_wait(argv, stdin_text, out))
+    except OSError as e:
+        report(f"[!] Could not run {argv[0]}: {e}")
         return None
+    if res.returncode != 0:
+        report(f"[!] Command failed: {argv} returned exit status {res.returncode}")
+        return None
+    return res
+
+
+def ip_batch(lines, out=None):
+    """Run several `ip` commands in one process via `ip -force -batch -`. Returns None on failure."""
+    # -force keeps going past a failed line (so a trailing `link set X up` still runs)
+    # while still exiting non-zero
+    return run(['ip', '-force', '-batch', '-'], stdin_text='\n'.join(lines) + '\n', out=out)
+
+
+def wait_unit_stopped(unit, timeout=10.0):
+    """Poll until a systemd unit has fully stopped. Returns False on timeout."""
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while True:
+        try:
+            out = subprocess.run(['systemctl', 'show', '--property=ActiveState', '--value', unit],
+                                 stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        except OSError:
+            return False
+        if out.stdout.strip() in ('inactive', 'failed'):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 1.0)
 
 # ----- network/wifi helpers -----
 
+def _nl80211_interfaces():
+    """Return wireless interfaces via an in-process nl80211 dump, or None if unavailable.
+
+    Only consulted when /sys/class/net is unreadable (see detect_wireless_interfaces).
+    """
+    if IW is None:
+        return None
+    try:
+        with IW() as iw:
+            return [msg.get_attr('NL80211_ATTR_IFNAME') for msg in iw.get_interfaces_dump()]
+    except (NetlinkError, OSError):
+        # nl80211 family not registered (no cfg80211) or netlink socket unavailable
+        return None
+
+
+def _sysfs_interfaces():
+    """Return wireless interfaces marked as such under /sys/class/net, or None if sysfs is unavailable."""
+    try:
+        entries = list(os.scandir('/sys/class/net'))
+    except OSError:
+        return None
+    return sorted(e.name for e in entries
+                  if os.path.isdir(f'{e.path}/wireless') or os.path.isdir(f'{e.path}/phy80211'))
+
+
 def detect_wireless_interfaces():
-    """Return a list of wireless interfaces detected via `iw dev` or ip."""
-    out = run('iw dev', capture=True)
+    """Return a list of wireless interfaces detected via sysfs, nl80211 (pyroute2), `iw dev` or ip."""
+    ifaces = _sysfs_interfaces()
+    if ifaces is not None:
+        return ifaces
+    # no sysfs: fall back to nl80211, then to parsing iw/ip output
+    ifaces = _nl80211_interfaces()
+    if ifaces is not None:
+        return list(dict.fromkeys(i for i in ifaces if i))
+    out = run(['iw', 'dev'], capture=True)
     if not out:
         return []
     text = out.stdout
-    ifaces = re.findall(r"Interface\s+(\S+)", text)
+    ifaces = _IFACE_RE.findall(text)
     if not ifaces:
-        out2 = run('ip -brief link', capture=True)
+        out2 = run(['ip', '-brief', 'link'], capture=True)
         if out2:
             for line in out2.stdout.splitlines():
                 name = line.split()[0]
@@ -118,9 +324,9 @@ def choose_interface(prompt="Select interface"):
     if not ifaces:
         print("[!] No wireless interfaces detected. Plug in your Alfa adapter and try again.")
         return None
-    print(f"Detected wireless interfaces: {', '.join(ifaces)}")
-    for i, iface in enumerate(ifaces, 1):
-        print(f"{i}. {iface}")
+    lines = [f"Detected wireless interfaces: {', '.join(ifaces)}"]
+    lines += [f"{i}. {iface}" for i, iface in enumerate(ifaces, 1)]
+    print('\n'.join(lines))
     choice = input(f"{prompt} (number): ").strip()
     try:
         idx = int(choice) - 1
@@ -133,24 +339,29 @@ def choose_interface(prompt="Select interface"):
 
 
 def generate_random_mac():
-    mac = [0x02, random.randint(0x00, 0xff), random.randint(0x00, 0xff),
-           random.randint(0x00, 0xff), random.randint(0x00, 0xff), random.randint(0x00, 0xff)]
-    return ':'.join(f"{b:02x}" for b in mac)
+    """Random locally-administered unicast MAC."""
+    b = bytearray(os.urandom(6))
+    b[0] = (b[0] & 0xfe) | 0x02
+    return b.hex(':')
 
 
 def get_current_mac(iface):
-    out = run(f'ip link show {iface}', capture=True)
+    try:
+        return Path(f'/sys/class/net/{iface}/address').read_text().strip() or None
+    except OSError:
+        pass
+    # no sysfs (e.g. some containers): fall back to parsing ip output
+    out = run(['ip', 'link', 'show', iface], capture=True)
     if not out:
         return None
-    m = re.search(r"link/ether\s+([0-9a-f:]{17})", out.stdout)
+    m = _MAC_RE.search(out.stdout)
     return m.group(1) if m else None
 
 # ----- main features -----
 
-def stealth_mode():
-    state = load_state()
-    print("\n=== Stealth mode ===")
-    print("This will stop NetworkManager and put your chosen adapter into monitor mode (airmon-ng preferred).")
+def stealth_mode(state):
+    print("\n=== Stealth mode ===\n"
+          "This will stop NetworkManager and put your chosen adapter into monitor mode (airmon-ng preferred).")
     confirm = input("Type YES to continue: ").strip()
     if confirm != "YES":
         print("Aborted by user.")
@@ -163,55 +374,56 @@ def stealth_mode():
     before_ifaces = detect_wireless_interfaces()
 
     print('[+] Stopping NetworkManager...')
-    res = run('systemctl stop NetworkManager')
+    # with airmon-ng there is work to overlap: queue the stop, run `check kill`, then wait.
+    # Otherwise nothing runs in between, so a plain blocking stop is cheaper than polling.
+    if HAS_AIRMON:
+        res = run(['systemctl', '--no-block', 'stop', 'NetworkManager'])
+    else:
+        res = run(['systemctl', 'stop', 'NetworkManager'])
     if res is None:
         print('[!] Failed to stop NetworkManager (or command returned error). Continuing but state may be inconsistent.')
     else:
         state['networkmanager_stopped'] = True
-        save_state(state)
 
-    if shutil.which('airmon-ng'):
+    if HAS_AIRMON:
         print('[+] Running: airmon-ng check kill')
-        run('airmon-ng check kill')
+        run(['airmon-ng', 'check', 'kill'])
     else:
         print('[i] airmon-ng not installed; attempting manual monitor mode.')
 
+    if HAS_AIRMON and res is not None and not wait_unit_stopped('NetworkManager'):
+        print('[!] NetworkManager is still stopping; it may interfere with monitor mode.')
+
     print(f'[+] Bringing down {iface}...')
-    run(f'ip link set {iface} down')
+    run(['ip', 'link', 'set', iface, 'down'])
 
-    if shutil.which('airmon-ng'):
+    if HAS_AIRMON:
         print(f'[+] Starting monitor mode via airmon-ng on {iface}...')
-        run(f'airmon-ng start {iface}')
-        after_ifaces = detect_wireless_interfaces()
-        mon_iface = None
-        for a in after_ifaces:
-            if a not in before_ifaces:
-                mon_iface = a
-                break
-        if not mon_iface:
-            mon_iface = iface + 'mon'
+        run(['airmon-ng', 'start', iface])
+        new_ifaces = set(detect_wireless_interfaces()) - set(before_ifaces)
+        mon_iface = min(new_ifaces, default=iface + 'mon')
         print(f'[i] Monitor-mode interface likely: {mon_iface}')
         state['monitor_interface'] = mon_iface
         state['original_interface'] = iface
-        save_state(state)
     else:
         print('[+] Attempting manual monitor mode using iw...')
-        run(f'iw dev {iface} set type monitor')
-        run(f'ip link set {iface} up')
+        run(['iw', 'dev', iface, 'set', 'type', 'monitor'])
+        run(['ip', 'link', 'set', iface, 'up'])
         print(f'[i] {iface} should now be in monitor mode (verify with iw dev).')
         state['monitor_interface'] = iface
         state['original_interface'] = iface
-        save_state(state)
 
 
-def mac_spoof():
-    state = load_state()
+def mac_spoof(state):
     print("\n=== MAC Spoof ===")
     iface = input("Enter interface to spoof (or press Enter to choose): ").strip()
     if not iface:
         iface = choose_interface()
         if not iface:
             return
+    if any(c.isspace() for c in iface):
+        print('[!] Invalid interface name.')
+        return
 
     if 'original_macs' not in state:
         state['original_macs'] = {}
@@ -220,7 +432,6 @@ def mac_spoof():
         orig = get_current_mac(iface)
         if orig:
             state['original_macs'][iface] = orig
-            save_state(state)
             print(f"[i] Saved original MAC for {iface}: {orig}")
         else:
             print('[i] Could not determine original MAC for this interface.')
@@ -228,43 +439,47 @@ def mac_spoof():
     new_mac = generate_random_mac()
     print(f'[+] Setting new MAC {new_mac} on {iface}...')
 
-    if shutil.which('macchanger'):
-        run(f'ip link set {iface} down')
-        run(f'macchanger -m {new_mac} {iface}')
-        run(f'ip link set {iface} up')
+    if HAS_MACCHANGER:
+        run(['ip', 'link', 'set', iface, 'down'])
+        run(['macchanger', '-m', new_mac, iface])
+        run(['ip', 'link', 'set', iface, 'up'])
     else:
-        run(f'ip link set {iface} down')
-        run(f'ip link set dev {iface} address {new_mac}')
-        run(f'ip link set {iface} up')
+        ip_batch([f'link set {iface} down',
+                  f'link set dev {iface} address {new_mac}',
+                  f'link set {iface} up'])
 
     state.setdefault('spoofed_macs', {})[iface] = new_mac
-    save_state(state)
     print(f'[+] MAC changed. Verify with: ip link show {iface}')
 
 
+def _truncate_one(lf):
+    """Truncate a single log file and return the status line to print."""
+    try:
+        os.truncate(lf, 0)
+        return f"[+] Truncated {lf}"
+    except FileNotFoundError:
+        return f"[i] Log file not present: {lf}"
+    except PermissionError:
+        return f"[!] Permission denied truncating {lf} (immutable or append-only?)"
+    except Exception as e:
+        return f"[!] Failed to truncate {lf}: {e}"
+
+
 def clear_logs():
-    print("\n=== Clear Logs ===")
-    print("This will TRUNCATE common log files and vacuum systemd journal. Destructive: proceed only on your systems.")
+    print("\n=== Clear Logs ===\n"
+          "This will TRUNCATE common log files and vacuum systemd journal. Destructive: proceed only on your systems.")
     confirm = input("Type CLEAR_LOGS to proceed: ").strip()
     if confirm != "CLEAR_LOGS":
         print("Aborted by user.")
         return
 
-    for lf in LOG_FILES:
-        if os.path.exists(lf):
-            try:
-                with open(lf, 'r+') as f:
-                    f.truncate(0)
-                print(f"[+] Truncated {lf}")
-            except Exception as e:
-                print(f"[!] Failed to truncate {lf}: {e}")
-        else:
-            print(f"[i] Log file not present: {lf}")
+    # truncate in parallel; map() keeps the messages in LOG_FILES order
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        print('\n'.join(ex.map(_truncate_one, LOG_FILES)))
 
-    if shutil.which('journalctl'):
+    if HAS_JOURNALCTL:
         print('[+] Rotating and vacuuming systemd journal...')
-        run('journalctl --rotate')
-        run('journalctl --vacuum-time=1s')
+        run(['journalctl', '--rotate', '--vacuum-time=1s'])
         print('[+] Journal vacuumed (older entries removed).')
     else:
         print('[!] journalctl not found; skipping journal vacuum.')
@@ -272,10 +487,36 @@ def clear_logs():
     print('[i] Note: some services recreate logs; some logs may reappear over time.')
 
 
-def restore_changes():
+def _restore_one_iface(item):
+    """Restore the MAC of one (iface, original_mac) pair; original may be None.
+
+    Runs in a worker thread, so all output (ours and the commands') is collected
+    and returned as one block for the caller to print.
+    """
+    iface, original = item
+    out = [f"[+] Restoring MAC for {iface}: {original if original else 'using macchanger -p (if available)'}"]
+    if original:
+        if HAS_MACCHANGER:
+            run(['ip', 'link', 'set', iface, 'down'], out=out)
+            run(['macchanger', '-m', original, iface], out=out)
+            run(['ip', 'link', 'set', iface, 'up'], out=out)
+        else:
+            ip_batch([f'link set {iface} down',
+                      f'link set dev {iface} address {original}',
+                      f'link set {iface} up'], out=out)
+    else:
+        if HAS_MACCHANGER:
+            run(['ip', 'link', 'set', iface, 'down'], out=out)
+            run(['macchanger', '-p', iface], out=out)
+            run(['ip', 'link', 'set', iface, 'up'], out=out)
+        else:
+            out.append(f"[!] No original MAC known for {iface} and macchanger missing. Manual fix required.")
+    return '\n'.join(out)
+
+
+def restore_changes(state):
     """Interactive restore — asks whether to stop monitor mode. If user keeps monitor mode, state is preserved for later restoration."""
     print("\n=== Restore Changes (interactive) ===")
-    state = load_state()
     if not state:
         print('[i] No saved state; nothing to restore.')
         return
@@ -284,25 +525,12 @@ def restore_changes():
     spoofed = state.get('spoofed_macs', {})
     origs = state.get('original_macs', {})
 
-    for iface, _ in spoofed.items():
-        original = origs.get(iface)
-        print(f"[+] Restoring MAC for {iface}: {original if original else 'using macchanger -p (if available)'}")
-        if original:
-            if shutil.which('macchanger'):
-                run(f'ip link set {iface} down')
-                run(f'macchanger -m {original} {iface}')
-                run(f'ip link set {iface} up')
-            else:
-                run(f'ip link set {iface} down')
-                run(f'ip link set dev {iface} address {original}')
-                run(f'ip link set {iface} up')
-        else:
-            if shutil.which('macchanger'):
-                run(f'ip link set {iface} down')
-                run(f'macchanger -p {iface}')
-                run(f'ip link set {iface} up')
-            else:
-                print(f"[!] No original MAC known for {iface} and macchanger missing. Manual fix required.")
+    # interfaces are independent, so restore them in parallel
+    if spoofed:
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            # map() keeps the per-interface blocks in order, like clear_logs
+            for block in ex.map(_restore_one_iface, [(iface, origs.get(iface)) for iface in spoofed]):
+                print(block)
 
     # Ask about monitor mode
     mon = state.get('monitor_interface')
@@ -312,13 +540,13 @@ def restore_changes():
         ans = input(f"Monitor interface detected ({mon}). Stop monitor mode and restore managed mode now? [y/N]: ").strip().lower()
         if ans in ('y', 'yes'):
             print(f"[+] Stopping monitor mode for {mon}...")
-            if shutil.which('airmon-ng'):
-                run(f'airmon-ng stop {mon}')
+            if HAS_AIRMON:
+                run(['airmon-ng', 'stop', mon])
             else:
                 if orig_iface:
-                    run(f'ip link set dev {orig_iface} down')
-                    run(f'iw dev {orig_iface} set type managed')
-                    run(f'ip link set dev {orig_iface} up')
+                    run(['ip', 'link', 'set', 'dev', orig_iface, 'down'])
+                    run(['iw', 'dev', orig_iface, 'set', 'type', 'managed'])
+                    run(['ip', 'link', 'set', 'dev', orig_iface, 'up'])
                 else:
                     print('[!] Could not determine original iface to restore managed type.')
             clear_after = True
@@ -326,25 +554,23 @@ def restore_changes():
             # preserve state so user can restore monitor later with option 5
             print('[i] Leaving interface in monitor mode. You can run option 5 to stop monitor mode later.')
             state['monitor_left'] = True
-            save_state(state)
             clear_after = False
 
     # Restart NetworkManager if it was stopped earlier
     if state.get('networkmanager_stopped'):
         print('[+] Starting NetworkManager...')
-        run('systemctl start NetworkManager')
+        run(['systemctl', '--no-block', 'start', 'NetworkManager'])
 
     if clear_after:
-        clear_state()
+        clear_state(state)
         print('[+] Restore finished; saved state cleared.')
     else:
         print('[+] Restore finished; saved state preserved for later monitor-only restore.')
 
 
-def restore_monitor_only():
+def restore_monitor_only(state):
     """Stop monitor mode only (if you previously chose to keep it). Then clear state."""
     print("\n=== Restore Monitor Only ===")
-    state = load_state()
     if not state:
         print('[i] No saved state found; nothing to do.')
         return
@@ -353,57 +579,69 @@ def restore_monitor_only():
     orig_iface = state.get('original_interface')
     if not mon:
         print('[i] No monitor interface recorded in state; clearing state and exiting.')
-        clear_state()
+        clear_state(state)
         return
 
     print(f"[+] Attempting to stop monitor mode interface: {mon}")
-    if shutil.which('airmon-ng'):
-        run(f'airmon-ng stop {mon}')
+    if HAS_AIRMON:
+        run(['airmon-ng', 'stop', mon])
     else:
         if orig_iface:
-            run(f'ip link set dev {orig_iface} down')
-            run(f'iw dev {orig_iface} set type managed')
-            run(f'ip link set dev {orig_iface} up')
+            run(['ip', 'link', 'set', 'dev', orig_iface, 'down'])
+            run(['iw', 'dev', orig_iface, 'set', 'type', 'managed'])
+            run(['ip', 'link', 'set', 'dev', orig_iface, 'up'])
         else:
             print('[!] Could not determine original iface to restore managed type.')
 
     # Start NetworkManager if tool had stopped it earlier
     if state.get('networkmanager_stopped'):
         print('[+] Starting NetworkManager...')
-        run('systemctl start NetworkManager')
+        run(['systemctl', '--no-block', 'start', 'NetworkManager'])
 
-    clear_state()
+    clear_state(state)
     print('[+] Monitor stopped (if possible) and state cleared.')
 
 
 # ----- CLI menu -----
 
+MENU_TEXT = '\n'.join([
+    '\n=== Stealth Tool ===',
+    '1. Stealth Mode (stop NetworkManager & enable monitor mode)',
+    '2. Spoof MAC for adapter (works with monitor-mode interfaces)',
+    '3. Clear logs (truncate common logs & vacuum journal)',
+    '4. Restore changes (interactive: ask to stop monitor mode)',
+    '5. Restore monitor only (stop monitor left active earlier)',
+    '0. Exit',
+])
+
+
 def menu():
     check_root()
+    # state lives in memory for the whole session and is flushed after each action
+    state = load_state()
     while True:
-        print('\n=== Stealth Tool ===')
-        print('1. Stealth Mode (stop NetworkManager & enable monitor mode)')
-        print('2. Spoof MAC for adapter (works with monitor-mode interfaces)')
-        print('3. Clear logs (truncate common logs & vacuum journal)')
-        print('4. Restore changes (interactive: ask to stop monitor mode)')
-        print('5. Restore monitor only (stop monitor left active earlier)')
-        print('0. Exit')
+        print(MENU_TEXT)
         choice = input('Select an option: ').strip()
-        if choice == '1':
-            stealth_mode()
-        elif choice == '2':
-            mac_spoof()
-        elif choice == '3':
-            clear_logs()
-        elif choice == '4':
-            restore_changes()
-        elif choice == '5':
-            restore_monitor_only()
-        elif choice == '0':
-            print('Exiting...')
-            sys.exit(0)
-        else:
-            print('Invalid choice. Try again.')
+        try:
+            if choice == '1':
+                stealth_mode(state)
+            elif choice == '2':
+                mac_spoof(state)
+            elif choice == '3':
+                clear_logs()
+            elif choice == '4':
+                restore_changes(state)
+            elif choice == '5':
+                restore_monitor_only(state)
+            elif choice == '0':
+                print('Exiting...')
+                sys.exit(0)
+            else:
+                print('Invalid choice. Try again.')
+        finally:
+            # also runs on Ctrl+C mid-action, so partial changes stay restorable
+            if state:
+                save_state(state)
 
 
 if __name__ == '__main__':